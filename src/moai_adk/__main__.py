@@ -157,17 +157,17 @@ def update(ctx: click.Context, **kwargs) -> None:
 @cli.command(name="statusline")
 def statusline() -> None:
     """Render Claude Code statusline (internal use only)"""
-    import json
-
     # Lazy load statusline module
-    from moai_adk.statusline.main import build_statusline_data
+    from moai_adk.statusline.main import (
+        build_statusline_data,
+        configure_stdout_encoding,
+        read_session_context,
+    )
 
-    try:
-        # Read JSON context from stdin
-        input_data = sys.stdin.read() if not sys.stdin.isatty() else "{}"
-        context = json.loads(input_data) if input_data else {}
-    except (json.JSONDecodeError, EOFError, ValueError):
-        context = {}
+    configure_stdout_encoding()
+
+    # Read JSON context from stdin
+    context = read_session_context()
 
     # Render statusline
     output = build_statusline_data(context, mode="extended")
@@ -33,7 +33,12 @@ def read_session_context() -> dict:
     """
     try:
         # Handle Docker/non-interactive environments by checking TTY
-        input_data = sys.stdin.read() if not sys.stdin.isatty() else "{}"
+        if sys.stdin.isatty():
+            input_data = "{}"
+        else:
+            # Prefer the raw byte stream: json.loads detects UTF-8/16/32 (and a BOM) itself,
+            # so the console code page never gets a chance to mangle the payload
+            input_data = getattr(sys.stdin, "buffer", sys.stdin).read()
         if input_data:
             try:
                 return json.loads(input_data)
@@ -41,7 +46,7 @@ def read_session_context() -> dict:
                 import logging
 
                 logging.error(f"Failed to parse JSON from stdin: {e}")
-                logging.debug(f"Input data: {input_data[:200]}")
+                logging.debug(f"Input data: {input_data[:200]!r}")
                 return {}
         return {}
     except (EOFError, ValueError) as e:
@@ -221,6 +226,17 @@ def build_statusline_data(session_context: dict, mode: str = "compact") -> str:
         return ""
 
 
+def configure_stdout_encoding() -> None:
+    """
+    Switch stdout to UTF-8 on Windows before the statusline is printed.
+
+    Emoji labels need UTF-8 output, but Windows consoles default to a legacy
+    code page. Reconfiguring once lets every later write skip the lossy codec path.
+    """
+    if sys.platform == "win32" and hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(encoding="utf-8", errors="replace")
+
+
 def main():
     """
     Main entry point for Claude Code statusline.
@@ -228,6 +244,8 @@ def main():
     Reads JSON from stdin, processes all information,
     and outputs the formatted statusline string.
     """
+    configure_stdout_encoding()
+
     # Debug mode check
     debug_mode = os.environ.get("MOAI_STATUSLINE_DEBUG") == "1"
 
@@ -11,9 +11,12 @@ from typing import List
 from .config import StatuslineConfig  # type: ignore[attr-defined]
 
 
-@dataclass
+@dataclass(slots=True)
 class StatuslineData:
-    """Status line data structure containing all necessary information"""
+    """Status line data structure containing all necessary information
+
+    Uses __slots__ so instances carry no per-instance __dict__.
+    """
 
     model: str
     version: str
@@ -14,16 +14,10 @@ TDD History:
 - REFACTOR: Cache configuration and error handling
 """
 
-import sys
 import time
-from pathlib import Path
 
-# Setup sys.path for hook imports
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
-LIB_DIR = PROJECT_ROOT / ".claude" / "hooks" / "moai" / "lib"
-sys.path.insert(0, str(LIB_DIR))
-
-from project import get_git_info, get_package_version_info  # noqa: E402
+# .claude/hooks/moai/lib is put on sys.path by tests/hooks/conftest.py
+from project import get_git_info, get_package_version_info
 
 
 class TestSessionStartPerformance:
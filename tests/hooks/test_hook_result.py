@@ -9,15 +9,9 @@ TDD History:
     - REFACTOR: 실제 HookResult API에 맞게 테스트 수정
 """
 import json
-import sys
-from pathlib import Path
 
-# Add hooks directory to path
-PROJECT_ROOT = Path(__file__).parent.parent.parent
-LIB_DIR = PROJECT_ROOT / ".claude" / "hooks" / "moai" / "lib"
-sys.path.insert(0, str(LIB_DIR))
-
-from models import HookResult  # noqa: E402
+# .claude/hooks/moai/lib is put on sys.path by tests/hooks/conftest.py
+from models import HookResult
 
 
 class TestHookResultSchema:
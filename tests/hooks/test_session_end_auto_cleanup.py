@@ -23,7 +23,8 @@ import pytest
 
 # Setup sys.path for hook imports
 HOOKS_DIR = Path(__file__).parent.parent.parent / ".claude" / "hooks" / "alfred"
-sys.path.insert(0, str(HOOKS_DIR))
+if str(HOOKS_DIR) not in sys.path:
+    sys.path.insert(0, str(HOOKS_DIR))
 
 
 @pytest.fixture
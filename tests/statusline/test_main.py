@@ -0,0 +1,164 @@
+"""
+Tests for statusline main entry point - 표준 입출력 처리
+
+"""
+
+import io
+import json
+import logging
+import sys
+from unittest.mock import patch
+
+
+class TestReadSessionContext:
+    """read_session_context() 표준 입력 처리 테스트"""
+
+    def test_reads_utf8_bytes_regardless_of_stdin_encoding(self):
+        """
+        GIVEN: 레거시 코드 페이지(cp1252) 텍스트 스트림으로 감싼 UTF-8 + BOM JSON
+        WHEN: read_session_context() 호출
+        THEN: 바이트 버퍼에서 직접 파싱하여 한글 경로와 BOM을 올바르게 처리
+        """
+        from moai_adk.statusline.main import read_session_context
+
+        payload = json.dumps({"cwd": "/home/user/프로젝트"}, ensure_ascii=False).encode("utf-8")
+        stdin = io.TextIOWrapper(io.BytesIO(b"\xef\xbb\xbf" + payload), encoding="cp1252")
+
+        with patch.object(sys, "stdin", stdin):
+            context = read_session_context()
+
+        assert context == {"cwd": "/home/user/프로젝트"}
+
+    def test_falls_back_to_text_stream_without_buffer(self):
+        """
+        GIVEN: buffer 속성이 없는 텍스트 스트림 (StringIO)
+        WHEN: read_session_context() 호출
+        THEN: 텍스트로 읽어서 정상적으로 파싱
+        """
+        from moai_adk.statusline.main import read_session_context
+
+        with patch.object(sys, "stdin", io.StringIO('{"model": {"name": "Sonnet"}}')):
+            context = read_session_context()
+
+        assert context == {"model": {"name": "Sonnet"}}
+
+    def test_invalid_json_returns_empty_dict(self):
+        """
+        GIVEN: JSON이 아닌 바이트 입력
+        WHEN: read_session_context() 호출
+        THEN: 빈 딕셔너리 반환
+        """
+        from moai_adk.statusline.main import read_session_context
+
+        stdin = io.TextIOWrapper(io.BytesIO(b"not json"), encoding="utf-8")
+
+        with patch.object(sys, "stdin", stdin):
+            context = read_session_context()
+
+        assert context == {}
+
+    def test_invalid_json_logs_input_repr(self, caplog):
+        """
+        GIVEN: JSON이 아닌 바이트 입력
+        WHEN: read_session_context() 호출
+        THEN: 디버그 로그에 입력 데이터의 repr을 남김
+        """
+        from moai_adk.statusline.main import read_session_context
+
+        stdin = io.TextIOWrapper(io.BytesIO(b"not json"), encoding="utf-8")
+
+        with patch.object(sys, "stdin", stdin), caplog.at_level(logging.DEBUG):
+            read_session_context()
+
+        assert "Input data: b'not json'" in caplog.text
+
+
+class TestStatuslineMainOutput:
+    """main() 출력 인코딩 테스트"""
+
+    def test_main_reconfigures_stdout_to_utf8_on_windows(self):
+        """
+        GIVEN: Windows 레거시 코드 페이지(cp1252)로 설정된 stdout
+        WHEN: main()이 이모지가 포함된 상태줄을 출력
+        THEN: stdout이 UTF-8로 재설정되어 이모지가 손실 없이 출력됨
+        """
+        from moai_adk.statusline import main as statusline_main
+
+        raw = io.BytesIO()
+        stdout = io.TextIOWrapper(raw, encoding="cp1252")
+
+        with (
+            patch.object(sys, "platform", "win32"),
+            patch.object(sys, "stdout", stdout),
+            patch.object(statusline_main, "read_session_context", return_value={}),
+            patch.object(statusline_main, "build_statusline_data", return_value="🤖 Model | 🗿 v0.30.2"),
+        ):
+            statusline_main.main()
+            stdout.flush()
+
+        assert stdout.encoding == "utf-8"
+        assert raw.getvalue().decode("utf-8") == "🤖 Model | 🗿 v0.30.2"
+
+    def test_main_leaves_stdout_encoding_on_other_platforms(self):
+        """
+        GIVEN: Windows가 아닌 플랫폼의 stdout
+        WHEN: main() 호출
+        THEN: stdout 인코딩을 변경하지 않음
+        """
+        from moai_adk.statusline import main as statusline_main
+
+        stdout = io.TextIOWrapper(io.BytesIO(), encoding="latin-1")
+
+        with (
+            patch.object(sys, "platform", "linux"),
+            patch.object(sys, "stdout", stdout),
+            patch.object(statusline_main, "read_session_context", return_value={}),
+            patch.object(statusline_main, "build_statusline_data", return_value="Model"),
+        ):
+            statusline_main.main()
+
+        assert stdout.encoding == "latin-1"
+
+
+class TestStatuslineCliCommand:
+    """`moai-adk statusline` CLI 명령 테스트 (Claude Code가 실제로 호출하는 경로)"""
+
+    def test_cli_reconfigures_stdout_to_utf8_on_windows(self):
+        """
+        GIVEN: Windows 레거시 코드 페이지(cp1252)로 설정된 stdout
+        WHEN: `moai-adk statusline`이 이모지가 포함된 상태줄을 출력
+        THEN: stdout이 UTF-8로 재설정되어 이모지가 손실 없이 출력됨
+        """
+        from click.testing import CliRunner
+
+        from moai_adk.__main__ import cli
+
+        runner = CliRunner(charset="cp1252")
+
+        with (
+            patch.object(sys, "platform", "win32"),
+            patch("moai_adk.statusline.main.build_statusline_data", return_value="🤖 Model | 🗿 v0.30.2"),
+        ):
+            result = runner.invoke(cli, ["statusline"], input="{}")
+
+        assert result.exit_code == 0, result.output
+        assert result.stdout_bytes.decode("utf-8") == "🤖 Model | 🗿 v0.30.2"
+
+    def test_cli_reads_session_context_from_stdin_bytes(self):
+        """
+        GIVEN: 레거시 코드 페이지(cp1252) stdin으로 전달된 UTF-8 + BOM JSON
+        WHEN: `moai-adk statusline` 실행
+        THEN: read_session_context()를 통해 바이트에서 파싱하여 한글 경로를 올바르게 전달
+        """
+        from click.testing import CliRunner
+
+        from moai_adk.__main__ import cli
+
+        payload = json.dumps({"cwd": "/home/user/프로젝트"}, ensure_ascii=False).encode("utf-8")
+        runner = CliRunner(charset="cp1252")
+
+        with patch("moai_adk.statusline.main.build_statusline_data", return_value="") as build:
+            result = runner.invoke(cli, ["statusline"], input=b"\xef\xbb\xbf" + payload)
+
+        assert result.exit_code == 0, result.output
+        build.assert_called_once_with({"cwd": "/home/user/프로젝트"}, mode="extended")
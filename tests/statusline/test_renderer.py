@@ -185,5 +185,33 @@ class TestStatuslineRendererDataHandling:
         assert "develop" in result
 
 
+class TestStatuslineDataLayout:
+    """StatuslineData 메모리 레이아웃 테스트"""
+
+    def test_statusline_data_uses_slots(self):
+        """
+        GIVEN: 실제 StatuslineData 인스턴스
+        WHEN: 인스턴스 속성 저장 방식을 확인
+        THEN: __slots__를 사용하여 인스턴스별 __dict__가 없음
+        """
+        from moai_adk.statusline.renderer import StatuslineData as RealStatuslineData
+
+        data = RealStatuslineData(
+            model="H 4.5",
+            version="0.20.1",
+            memory_usage="128MB",
+            branch="main",
+            git_status="",
+            duration="5m",
+            directory="proj",
+            active_task="",
+        )
+
+        assert hasattr(RealStatuslineData, "__slots__")
+        assert not hasattr(data, "__dict__")
+        with pytest.raises(AttributeError):
+            data.unknown_field = "value"
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
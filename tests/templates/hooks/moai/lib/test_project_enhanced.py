@@ -15,8 +15,10 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-sys.path.insert(0, "src/moai_adk/templates/.claude/hooks/moai/lib")
-from project import (
+TEMPLATE_LIB_DIR = "src/moai_adk/templates/.claude/hooks/moai/lib"
+if TEMPLATE_LIB_DIR not in sys.path:
+    sys.path.insert(0, TEMPLATE_LIB_DIR)
+from project import (  # noqa: E402
     count_specs,
     detect_language,
     find_project_root,
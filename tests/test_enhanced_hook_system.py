@@ -17,57 +17,27 @@ Test Coverage:
 
 import time
 from datetime import datetime
-from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
 # Import enhanced hook system components
-try:
-    from src.moai_adk.core.jit_context_loader import JITContextLoader
-    from src.moai_adk.core.jit_enhanced_hook_manager import (
-        HookEvent,
-        HookExecutionResult,
-        HookMetadata,
-        HookPerformanceMetrics,
-        HookPriority,
-        JITEnhancedHookManager,
-        execute_session_start_hooks,
-        get_jit_hook_manager,
-    )
-    from src.moai_adk.core.phase_optimized_hook_scheduler import (
-        ExecutionGroup,
-        HookSchedulingContext,
-        Phase,
-        PhaseOptimizedHookScheduler,
-        ScheduledHook,
-        SchedulingDecision,
-        SchedulingResult,
-        SchedulingStrategy,
-    )
-except ImportError:
-    # Fallback imports for testing environment
-    import sys
-    from pathlib import Path
-
-    sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-    from moai_adk.core.jit_enhanced_hook_manager import (
-        HookEvent,
-        HookMetadata,
-        HookPriority,
-        JITEnhancedHookManager,
-        execute_session_start_hooks,
-    )
-    from moai_adk.core.phase_optimized_hook_scheduler import (
-        HookSchedulingContext,
-        Phase,
-        PhaseOptimizedHookScheduler,
-        ScheduledHook,
-        SchedulingDecision,
-        SchedulingResult,
-        SchedulingStrategy,
-    )
+from moai_adk.core.jit_enhanced_hook_manager import (
+    HookEvent,
+    HookMetadata,
+    HookPriority,
+    JITEnhancedHookManager,
+    execute_session_start_hooks,
+)
+from moai_adk.core.phase_optimized_hook_scheduler import (
+    HookSchedulingContext,
+    Phase,
+    PhaseOptimizedHookScheduler,
+    ScheduledHook,
+    SchedulingDecision,
+    SchedulingResult,
+    SchedulingStrategy,
+)
 
 
 # Fixtures and test data
@@ -163,7 +133,7 @@ def mock_jit_loader():
 @pytest.fixture
 def hook_manager(temp_hooks_directory, temp_cache_directory, mock_jit_loader):
     """Create JIT-Enhanced Hook Manager with mocked dependencies"""
-    with patch("src.moai_adk.core.jit_enhanced_hook_manager.JITContextLoader", return_value=mock_jit_loader):
+    with patch("moai_adk.core.jit_enhanced_hook_manager.JITContextLoader", return_value=mock_jit_loader):
         manager = JITEnhancedHookManager(
             hooks_directory=temp_hooks_directory, cache_directory=temp_cache_directory, max_concurrent_hooks=3
         )
@@ -363,7 +333,7 @@ class TestJITEnhancedHookManager:
     @pytest.mark.asyncio
     async def test_global_hook_manager_functions(self, hook_manager, sample_context):
         """Test global convenience functions"""
-        with patch("src.moai_adk.core.jit_enhanced_hook_manager.get_jit_hook_manager", return_value=hook_manager):
+        with patch("moai_adk.core.jit_enhanced_hook_manager.get_jit_hook_manager", return_value=hook_manager):
             # Test session start hooks execution
             results = await execute_session_start_hooks(sample_context, "Test global function")
 
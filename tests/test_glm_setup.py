@@ -21,7 +21,8 @@ import pytest
 pytestmark = pytest.mark.skip(reason="setup-glm.py only exists in src/moai_adk/templates, not in local .moai/scripts")
 
 moai_scripts_path = Path(__file__).parent.parent / ".moai" / "scripts"
-sys.path.insert(0, str(moai_scripts_path))
+if str(moai_scripts_path) not in sys.path:
+    sys.path.insert(0, str(moai_scripts_path))
 
 # Import using importlib to handle the script file
 import importlib.util
@@ -17,6 +17,15 @@ from pathlib import Path
 
 import pytest
 
+HOOKS_DIR = Path(__file__).parent.parent / "src/moai_adk/templates/.claude/hooks"
+
+
+@pytest.fixture
+def hooks_dir() -> Path:
+    """Get hooks directory path"""
+    return HOOKS_DIR
+
+
 # ==============================================================================
 # Test Suite 1: Duplicate File Identification (Task 2.1)
 # ==============================================================================
@@ -25,11 +34,6 @@ import pytest
 class TestDuplicateIdentification:
     """GREEN Phase: Tests for identifying duplicate files (after consolidation)"""
 
-    @pytest.fixture
-    def hooks_dir(self) -> Path:
-        """Get hooks directory path"""
-        return Path(__file__).parent.parent / "src/moai_adk/templates/.claude/hooks"
-
     def test_timeout_duplicate_consolidation_complete(self, hooks_dir: Path):
         """Test: moai/core/timeout.py has been deleted (consolidation complete)"""
         core_timeout = hooks_dir / "moai" / "core" / "timeout.py"
@@ -84,81 +88,61 @@ class TestDuplicateIdentification:
 class TestCodeConsolidation:
     """RED Phase: Tests for code consolidation into moai/shared/core"""
 
-    @pytest.fixture
-    def hooks_dir(self) -> Path:
-        """Get hooks directory path"""
-        return Path(__file__).parent.parent / "src/moai_adk/templates/.claude/hooks"
-
-    def test_shared_core_timeout_module_imports(self, hooks_dir: Path):
+    def test_shared_core_timeout_module_imports(self, hooks_dir: Path, monkeypatch: pytest.MonkeyPatch):
         """Test: moai.shared.core.timeout module is importable"""
-        sys.path.insert(0, str(hooks_dir))
+        monkeypatch.syspath_prepend(str(hooks_dir))
 
-        try:
-            from moai.shared.core.timeout import CrossPlatformTimeout, timeout_context
+        from moai.shared.core.timeout import CrossPlatformTimeout, timeout_context
 
-            assert CrossPlatformTimeout is not None
-            assert timeout_context is not None
-        finally:
-            sys.path.pop(0)
+        assert CrossPlatformTimeout is not None
+        assert timeout_context is not None
 
-    def test_shared_core_version_cache_module_imports(self, hooks_dir: Path):
+    def test_shared_core_version_cache_module_imports(self, hooks_dir: Path, monkeypatch: pytest.MonkeyPatch):
         """Test: moai.shared.core.version_cache module is importable"""
-        sys.path.insert(0, str(hooks_dir))
+        monkeypatch.syspath_prepend(str(hooks_dir))
 
-        try:
-            from moai.shared.core.version_cache import VersionCache
+        from moai.shared.core.version_cache import VersionCache
 
-            assert VersionCache is not None
-        finally:
-            sys.path.pop(0)
+        assert VersionCache is not None
 
-    def test_timeout_manager_creation(self, hooks_dir: Path):
+    def test_timeout_manager_creation(self, hooks_dir: Path, monkeypatch: pytest.MonkeyPatch):
         """Test: TimeoutManager can be instantiated"""
-        sys.path.insert(0, str(hooks_dir))
+        monkeypatch.syspath_prepend(str(hooks_dir))
 
-        try:
-            from moai.shared.core.timeout import CrossPlatformTimeout
+        from moai.shared.core.timeout import CrossPlatformTimeout
 
-            timeout = CrossPlatformTimeout(timeout_seconds=5)
-            assert timeout is not None
-            assert timeout.timeout_seconds == 5
-        finally:
-            sys.path.pop(0)
+        timeout = CrossPlatformTimeout(timeout_seconds=5)
+        assert timeout is not None
+        assert timeout.timeout_seconds == 5
 
-    def test_version_cache_creation(self, hooks_dir: Path):
+    def test_version_cache_creation(self, hooks_dir: Path, monkeypatch: pytest.MonkeyPatch):
         """Test: VersionCache can be instantiated"""
-        sys.path.insert(0, str(hooks_dir))
+        monkeypatch.syspath_prepend(str(hooks_dir))
 
-        try:
-            from moai.shared.core.version_cache import VersionCache
+        from moai.shared.core.version_cache import VersionCache
 
-            cache = VersionCache(cache_dir=Path("/tmp/test"), ttl_hours=24)
-            assert cache is not None
-            assert cache.ttl_hours == 24
-        finally:
-            sys.path.pop(0)
+        cache = VersionCache(cache_dir=Path("/tmp/test"), ttl_hours=24)
+        assert cache is not None
+        assert cache.ttl_hours == 24
 
-    def test_version_cache_set_get(self, hooks_dir: Path, tmp_path: Path):
+    def test_version_cache_set_get(self, hooks_dir: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
         """Test: VersionCache can set and get values"""
-        sys.path.insert(0, str(hooks_dir))
+        monkeypatch.syspath_prepend(str(hooks_dir))
 
-        try:
-            from moai.shared.core.version_cache import VersionCache
+        from moai.shared.core.version_cache import VersionCache
 
-            cache = VersionCache(cache_dir=tmp_path, ttl_hours=24)
+        cache = VersionCache(cache_dir=tmp_path, ttl_hours=24)
 
-            # Save data
-            test_data = {"current_version": "0.26.0", "latest_version": "0.27.0"}
-            success = cache.save(test_data)
-            assert success is True, "Cache save should succeed"
+        # Save data
+        test_data = {"current_version": "0.26.0", "latest_version": "0.27.0"}
+        success = cache.save(test_data)
+        assert success is True, "Cache save should succeed"
 
-            # Load data
-            loaded = cache.load()
-            assert loaded is not None, "Cache load should return data"
-            assert loaded["current_version"] == "0.26.0"
-            assert loaded["latest_version"] == "0.27.0"
-        finally:
-            sys.path.pop(0)
+        # Load data
+        loaded = cache.load()
+        assert loaded is not None, "Cache load should return data"
+        assert loaded["current_version"] == "0.26.0"
+        assert loaded["latest_version"] == "0.27.0"
 
 
 # ==============================================================================
@@ -169,11 +153,6 @@ class TestCodeConsolidation:
 class TestImportPathMigration:
     """RED Phase: Tests for import path standardization"""
 
-    @pytest.fixture
-    def hooks_dir(self) -> Path:
-        """Get hooks directory path"""
-        return Path(__file__).parent.parent / "src/moai_adk/templates/.claude/hooks"
-
     def test_all_files_import_from_moai_shared(self, hooks_dir: Path):
         """Test: All hook files use imports from moai.shared.* pattern"""
         py_files = list(hooks_dir.rglob("*.py"))
@@ -191,9 +170,9 @@ class TestImportPathMigration:
         # For now, we're expecting some relative imports (before migration)
         # After migration, this test should show: assert len(relative_imports_found) == 0
 
-    def test_no_circular_imports(self, hooks_dir: Path):
+    def test_no_circular_imports(self, hooks_dir: Path, monkeypatch: pytest.MonkeyPatch):
         """Test: No circular import dependencies"""
-        sys.path.insert(0, str(hooks_dir))
+        monkeypatch.syspath_prepend(str(hooks_dir))
 
         try:
             # Try importing main modules
@@ -204,8 +183,6 @@ class TestImportPathMigration:
             assert version_cache is not None
         except ImportError as e:
             pytest.fail(f"Circular import detected: {e}")
-        finally:
-            sys.path.pop(0)
 
     def test_all_py_files_compile(self, hooks_dir: Path):
         """Test: All Python files compile without syntax errors"""
@@ -229,11 +206,6 @@ class TestImportPathMigration:
 class TestIntegrationAndPerformance:
     """RED Phase: Tests for integration and performance baseline"""
 
-    @pytest.fixture
-    def hooks_dir(self) -> Path:
-        """Get hooks directory path"""
-        return Path(__file__).parent.parent / "src/moai_adk/templates/.claude/hooks"
-
     def test_hook_json_interface(self, hooks_dir: Path):
         """Test: Hook files implement JSON stdin/stdout interface"""
         # Find main hook files (in moai/ directory, not in subdirectories)
@@ -300,11 +272,6 @@ class TestIntegrationAndPerformance:
 class TestAcceptanceCriteria:
     """REFACTOR Phase: Tests for overall acceptance criteria"""
 
-    @pytest.fixture
-    def hooks_dir(self) -> Path:
-        """Get hooks directory path"""
-        return Path(__file__).parent.parent / "src/moai_adk/templates/.claude/hooks"
-
     def test_moai_core_directory_removed_after_consolidation(self, hooks_dir: Path):
         """Test: moai/core/ directory has been removed after consolidation"""
         core_dir = hooks_dir / "moai" / "core"
@@ -8,14 +8,9 @@ Author: MoAI-ADK Core Team
 Version: 1.0.0
 """
 
-import os
-import sys
 import time
 import unittest
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from moai_adk.core.input_validation_middleware import (
     EnhancedInputValidationMiddleware,
     ToolParameter,
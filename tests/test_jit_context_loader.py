@@ -10,8 +10,6 @@ Tests the Phase 2 implementation covering:
 - Overall system integration
 """
 
-import os
-import sys
 import tempfile
 import time
 from pathlib import Path
@@ -19,8 +17,6 @@ from unittest.mock import patch
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from moai_adk.core.jit_context_loader import (
     ContextCache,
     ContextMetrics,
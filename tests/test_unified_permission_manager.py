@@ -10,13 +10,9 @@ Version: 1.0.0
 
 import json
 import os
-import sys
 import tempfile
 import unittest
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
-
 from moai_adk.core.unified_permission_manager import (
     PermissionAudit,
     PermissionMode,
@@ -14,17 +14,12 @@ import signal
 import sys
 import threading
 import time
-from pathlib import Path
 from unittest import mock
 
 import pytest
 
-# Add src path to sys.path for imports
-src_path = Path(__file__).parent.parent.parent / "src"
-sys.path.insert(0, str(src_path))
-
 # Import the module to test
-from moai_adk.utils.timeout import CrossPlatformTimeout, TimeoutError  # noqa: E402
+from moai_adk.utils.timeout import CrossPlatformTimeout, TimeoutError
 
 
 class TestCrossPlatformTimeoutWindows:
@@ -6,12 +6,8 @@ then be implemented in the GREEN phase with testing.py classes.
 """
 
 import os
-import sys
 import unittest
 
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "src"))
-
 from moai_adk.foundation.testing import (
     CoverageAnalyzer,
     QualityGateEngine,